@@ -9,17 +9,41 @@ build_llms_txt.py – produce llms.txt and llms-full.txt
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import os
 from pathlib import Path
 import re
 import sys
 import textwrap
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Tuple
 import urllib.error
 import urllib.request
 
-RE_JAVA = re.compile(r"```java[ \t\r\n][\s\S]*?```", re.I | re.M)
+RE_JAVA_OPEN = re.compile(r"```java[ \t\r\n]", re.I)
+RE_HEADING = re.compile(r"^#+(.*)$", re.M)
 RE_SNIPPET = re.compile(r"^(\s*)--8<--\s+\"([^\"]+?)(?::([^\"]+))?\"$", re.M)
+RE_HTML_TAG = re.compile(r"<[^>]*>")
+RE_MD_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+RE_MD_LINK_TARGET = re.compile(r"\]\([^)]*\)")
+RE_MD_INLINE = re.compile(r"[*_`\[\]]")
+RE_MD_FENCE = re.compile(r"^(```|~~~)")
+RE_MD_LIST_ITEM = re.compile(r"^(?:[-*+]|\d+[.)])\s")
+
+# Below this many pages, forking worker processes costs more than it saves.
+PARALLEL_MIN_PAGES = 32
+
+# Text is tokenized in pieces of roughly this many characters so the token
+# list for a large corpus is never held in memory all at once.
+TOKEN_CHUNK_CHARS = 64 * 1024
+
+# Doc sections listed under "Optional" in llms.txt.
+SECONDARY_DIRS = frozenset({"sample", "tutorial"})
 
 
 def fetch_adk_python_readme() -> str:
@@ -34,14 +58,121 @@ def fetch_adk_python_readme() -> str:
 
 
 def strip_java(md: str) -> str:
-  return RE_JAVA.sub("", md)
+  """Remove ```java fenced blocks from `md` in a single linear scan.
+
+  Only the opening tag is matched with a regex; the closing fence is found with
+  str.find, so no lazy quantifier has to backtrack over the block body. An
+  unterminated block is kept as is.
+  """
+  out = []
+  start = 0
+  while m := RE_JAVA_OPEN.search(md, start):
+    close = md.find("```", m.end())
+    if close < 0:
+      break
+    out.append(md[start : m.start()])
+    start = close + 3
+  out.append(md[start:])
+  return "".join(out)
 
 
 def first_heading(md: str) -> str | None:
-  for line in md.splitlines():
-    if line.startswith("#"):
-      return line.lstrip("#").strip()
-  return None
+  m = RE_HEADING.search(md)
+  return m.group(1).strip() if m else None
+
+
+def first_paragraph(md: str) -> str:
+  """Return the first prose paragraph of `md` as plain text.
+
+  Headings end a paragraph and are skipped. So are fenced code blocks, and
+  list or HTML blocks, which run to the next blank line.
+  """
+  para: List[str] = []
+  fence = None
+  skip_block = False
+  for line in md.splitlines() + [""]:
+    line = line.strip()
+    if fence:
+      if line.startswith(fence):
+        fence = None
+      continue
+    if m := RE_MD_FENCE.match(line):
+      fence = m.group(1)
+    elif not line or line.startswith("#"):
+      skip_block = False
+    elif RE_MD_LIST_ITEM.match(line) or (not para and line.startswith("<")):
+      skip_block = True
+    elif not skip_block:
+      para.append(line)
+      continue
+    if para:
+      text = RE_MD_IMAGE.sub("", RE_HTML_TAG.sub(" ", " ".join(para)))
+      text = RE_MD_INLINE.sub("", RE_MD_LINK_TARGET.sub("]", text))
+      text = " ".join(text.split())
+      if text:
+        return text
+      para = []
+  return ""
+
+
+def md_files(docs: Path) -> List[str]:
+  """List Markdown files under `docs` as sorted relative paths.
+
+  Walks the tree with plain strings so no Path object is built per file.
+  Java API reference pages are skipped.
+  """
+  root = str(docs)
+  found = []
+  for dirpath, _, filenames in os.walk(root):
+    rel_dir = os.path.relpath(dirpath, root)
+    parts = () if rel_dir == os.curdir else tuple(rel_dir.split(os.sep))
+    if "api-reference" in parts and "java" in parts:
+      continue
+    for name in filenames:
+      if name.endswith(".md"):
+        found.append(parts + (name,))
+  return [os.path.join(*parts) for parts in sorted(found)]
+
+
+def read_utf8(path: str | os.PathLike[str]) -> str:
+  """Read a UTF-8 file as bytes and decode it in one step.
+
+  Line endings are normalised to "\\n", as text mode would, so CRLF checkouts
+  still match the line-anchored regexes such as RE_SNIPPET.
+  """
+  with open(path, "rb") as f:
+    text = f.read().decode("utf-8")
+  return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def load_md(path: str) -> Tuple[str, Optional[str]]:
+  """Read a Markdown file, returning its Java-free text and first heading."""
+  md = strip_java(read_utf8(path))
+  return md, first_heading(md)
+
+
+def load_docs(docs: Path) -> Dict[str, Tuple[str, Optional[str]]]:
+  """Load every Markdown file under `docs`, keyed by sorted relative path."""
+  rels = md_files(docs)
+  paths = [os.path.join(docs, rel) for rel in rels]
+  if len(paths) < PARALLEL_MIN_PAGES:
+    return dict(zip(rels, map(load_md, paths)))
+  with concurrent.futures.ProcessPoolExecutor() as ex:
+    return dict(zip(rels, ex.map(load_md, paths, chunksize=16)))
+
+
+@functools.cache
+def html_parser() -> str:
+  """Return the fastest available BeautifulSoup parser backend.
+
+  Cached so a missing lxml is only searched for once per run.
+  """
+  try:
+    import lxml  # noqa: F401
+
+    return "lxml"
+  except ImportError:
+    return "html.parser"
 
 
 def md_to_text(md: str) -> str:
@@ -51,7 +182,7 @@ def md_to_text(md: str) -> str:
   html = markdown.markdown(
       md, extensions=["fenced_code", "tables", "attr_list"]
   )
-  return bs4.BeautifulSoup(html, "html.parser").get_text("\n")
+  return bs4.BeautifulSoup(html, html_parser()).get_text("\n")
 
 
 def html_to_text(html_file: Path) -> str:
@@ -59,8 +190,8 @@ def html_to_text(html_file: Path) -> str:
   import bs4
 
   try:
-    html_content = html_file.read_text(encoding="utf-8")
-    soup = bs4.BeautifulSoup(html_content, "html.parser")
+    html_content = read_utf8(html_file)
+    soup = bs4.BeautifulSoup(html_content, html_parser())
 
     # Remove script and style elements
     for script in soup(["script", "style"]):
@@ -78,11 +209,39 @@ def html_to_text(html_file: Path) -> str:
     return ""
 
 
-def count_tokens(text: str, model: str = "cl100k_base") -> int:
+@functools.lru_cache(maxsize=4)
+def get_encoding(model: str):
+  """Load a tokenizer encoding once and reuse it across count_tokens calls.
+
+  Prefers riptoken, a faster drop-in replacement for tiktoken that produces
+  identical tokens, and falls back to tiktoken when it is not installed.
+  Returns None if no encoding can be loaded, e.g. when the BPE file cannot be
+  downloaded offline; the failure is cached too so it is not retried.
+  """
   try:
-    import tiktoken
+    try:
+      import riptoken as tokenizer
+    except ImportError:
+      import tiktoken as tokenizer
+
+    return tokenizer.get_encoding(model)
+  except Exception:
+    return None
 
-    return len(tiktoken.get_encoding(model).encode(text))
+
+def count_tokens(text: str, model: str = "cl100k_base") -> int:
+  enc = get_encoding(model)
+  if enc is None:
+    return len(text.split())
+  try:
+    total = start = 0
+    while start < len(text):
+      # Cut on line ends so chunk boundaries rarely split a token.
+      end = text.find("\n", start + TOKEN_CHUNK_CHARS)
+      end = len(text) if end < 0 else end + 1
+      total += len(enc.encode(text[start:end]))
+      start = end
+    return total
   except Exception:
     return len(text.split())
 
@@ -114,7 +273,7 @@ def expand_code_snippets(content: str, project_root: Path) -> str:
 
     if snippet_full_path.exists():
       try:
-        file_content = snippet_full_path.read_text(encoding="utf-8")
+        file_content = read_utf8(snippet_full_path)
         if section_name:
           # Extract content based on section markers
           # Handle both single and double hash markers with optional spacing
@@ -181,17 +340,17 @@ def expand_code_snippets(content: str, project_root: Path) -> str:
 
 
 # ---------- index (llms.txt) ----------
-def build_index(docs: Path) -> str:
+def build_index(docs: Path, pages: Dict[str, Tuple[str, Optional[str]]]) -> str:
   # Locate README
   for cand in (docs / "README.md", docs.parent / "README.md"):
     if cand.exists():
-      readme = cand.read_text(encoding="utf-8")
+      readme = read_utf8(cand)
       break
   else:
     sys.exit("README.md not found in docs/ or its parent")
 
   title = first_heading(readme) or "Documentation"
-  summary = md_to_text(readme).split("\n\n")[0]
+  summary = first_paragraph(readme)
   lines = [f"# {title}", "", f"> {summary}", ""]
 
   # Add adk-python repository README content
@@ -213,21 +372,14 @@ def build_index(docs: Path) -> str:
   secondary: List[Tuple[str, str]] = []
 
   # Process Markdown files
-  for md in sorted(docs.rglob("*.md")):
-    # Skip Java API reference files
-    if "api-reference" in md.parts and "java" in md.parts:
-      continue
-
-    rel = md.relative_to(docs)
+  for rel, (_, heading) in pages.items():
     # Construct the correct GitHub URL for the Markdown file
     url = f"https://github.com/google/adk-docs/blob/main/docs/{rel}".replace(
         " ", "%20"
     )
-    h = first_heading(strip_java(md.read_text(encoding="utf-8"))) or rel.stem
+    h = heading or os.path.splitext(os.path.basename(rel))[0]
     (
-        secondary
-        if "sample" in rel.parts or "tutorial" in rel.parts
-        else primary
+        primary if SECONDARY_DIRS.isdisjoint(rel.split(os.sep)) else secondary
     ).append((h, url))
 
   # Add Python API reference
@@ -251,9 +403,10 @@ def build_index(docs: Path) -> str:
 
 
 # ---------- full corpus ----------
-def build_full(docs: Path) -> str:
-  out = []
-
+def build_full(
+    docs: Path, pages: Dict[str, Tuple[str, Optional[str]]]
+) -> Iterator[str]:
+  """Yield the sections of llms-full.txt, to be joined by blank lines."""
   script_dir = Path(__file__).resolve().parent
   project_root = script_dir.parents[2]  # Correct project root
   print(f"DEBUG: Project Root: {project_root}")
@@ -266,31 +419,26 @@ def build_full(docs: Path) -> str:
     expanded_adk_readme = expand_code_snippets(
         strip_java(adk_readme), project_root
     )  # Pass project_root
-    out.append("# ADK Python Repository")
-    out.append("")
-    out.append(expanded_adk_readme)  # Use expanded content
-    out.append("")
-    out.append("---")
-    out.append("")
+    yield "# ADK Python Repository"
+    yield ""
+    yield expanded_adk_readme  # Use expanded content
+    yield ""
+    yield "---"
+    yield ""
 
   # Process Markdown files
-  for md in sorted(docs.rglob("*.md")):
-    # Skip Java API reference files
-    if "api-reference" in md.parts and "java" in md.parts:
-      continue
-
-    md_content = md.read_text(encoding="utf-8")
-    print(f"DEBUG: Processing markdown file: {md.relative_to(docs)}")
+  for rel, (md_content, _) in pages.items():
+    print(f"DEBUG: Processing markdown file: {rel}")
     expanded_md_content = expand_code_snippets(
-        strip_java(md_content), project_root
+        md_content, project_root
     )  # Changed back to project_root
-    out.append(expanded_md_content)  # Use expanded content
+    yield expanded_md_content  # Use expanded content
 
   # Process Python API reference HTML files
   python_api_dir = docs / "api-reference" / "python"
   if python_api_dir.exists():
     # Add a separator and header for Python API reference
-    out.append("\n\n# Python API Reference\n")
+    yield "\n\n# Python API Reference\n"
 
     # Process main HTML files (skip static assets and generated files)
     html_files = [
@@ -304,10 +452,20 @@ def build_full(docs: Path) -> str:
       if html_file.exists():
         text = html_to_text(html_file)
         if text.strip():
-          out.append(f"\n## {html_file.stem}\n")
-          out.append(text)
+          yield f"\n## {html_file.stem}\n"
+          yield text
+
 
-  return "\n\n".join(out)
+def write_full(out_path: Path, sections: Iterable[str]) -> int:
+  """Stream `sections` to `out_path`, returning the total token count."""
+  tokens = 0
+  with open(out_path, "w", encoding="utf-8") as f:
+    for i, section in enumerate(sections):
+      if i:
+        f.write("\n\n")
+      f.write(section)
+      tokens += count_tokens(section)
+  return tokens
 
 
 def main() -> None:
@@ -321,17 +479,25 @@ def main() -> None:
   ap.add_argument("--full-limit", type=int, default=500_000)
   args = ap.parse_args()
 
-  idx, full = build_index(args.docs_dir), build_full(args.docs_dir)
-  if (tok := count_tokens(idx)) > args.index_limit:
-    sys.exit(f"Index too big: {tok:,}")
-  if (tok := count_tokens(full)) > args.full_limit:
-    sys.exit(f"Full text too big: {tok:,}")
+  pages = load_docs(args.docs_dir)
+  idx = build_index(args.docs_dir, pages)
+  if (idx_tokens := count_tokens(idx)) > args.index_limit:
+    sys.exit(f"Index too big: {idx_tokens:,}")
+
+  # Stream the full corpus to a temporary file so nothing is left behind if
+  # it turns out to be over the limit.
+  full_path = args.out_root / "llms-full.txt"
+  tmp_path = full_path.with_name(full_path.name + ".tmp")
+  full_tokens = write_full(tmp_path, build_full(args.docs_dir, pages))
+  if full_tokens > args.full_limit:
+    tmp_path.unlink()
+    sys.exit(f"Full text too big: {full_tokens:,}")
 
   (args.out_root / "llms.txt").write_text(idx, encoding="utf-8")
-  (args.out_root / "llms-full.txt").write_text(full, encoding="utf-8")
+  tmp_path.replace(full_path)
   print("✅ Generated llms.txt and llms-full.txt successfully")
-  print(f"llms.txt tokens: {count_tokens(idx)}")
-  print(f"llms-full.txt tokens: {count_tokens(full)}")
+  print(f"llms.txt tokens: {idx_tokens}")
+  print(f"llms-full.txt tokens: {full_tokens}")
 
 
 if __name__ == "__main__":
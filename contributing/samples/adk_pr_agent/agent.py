@@ -14,7 +14,10 @@
 
 # pylint: disable=g-importing-member
 
+import concurrent.futures
 import os
+from typing import Any
+import urllib.parse
 
 from google.adk import Agent
 import requests
@@ -26,6 +29,73 @@ if not GITHUB_TOKEN:
 OWNER = os.getenv("OWNER", "google")
 REPO = os.getenv("REPO", "adk-python")
 
+# Reuse one pooled connection for every GitHub API call instead of opening a
+# new TCP/TLS connection per request and per commits page.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Accept": "application/vnd.github+json",
+    "Authorization": f"Bearer {GITHUB_TOKEN}",
+    "X-GitHub-Api-Version": "2022-11-28",
+})
+_TIMEOUT_SECONDS = 10
+_MAX_PAGE_WORKERS = 8
+
+
+def _get_commits_page(commits_url: str, page: int) -> requests.Response:
+  """Fetches one page of up to 100 commits."""
+  # GitHub API often uses 'per_page' and 'page' for pagination
+  params = {"per_page": 100, "page": page}
+  response = _SESSION.get(commits_url, params=params, timeout=_TIMEOUT_SECONDS)
+  response.raise_for_status()
+  return response
+
+
+def _get_commit_pages(commits_url: str) -> list[list[dict[str, Any]]]:
+  """Fetches every page of commits behind a paginated commits URL.
+
+  The first response's 'Link' header tells how many pages there are, so the
+  remaining pages are requested concurrently rather than one after another.
+  If a page fails, the pages before it are still returned.
+
+  Args:
+      commits_url (str): The commits URL from the PR details.
+
+  Returns:
+      The JSON commit lists, one per page, in page order.
+  """
+  pages = []
+  page = 1
+  try:
+    response = _get_commits_page(commits_url, page)
+    pages.append(response.json())
+
+    # This is how GitHub's API indicates pagination
+    last_url = response.links.get("last", {}).get("url")
+    if last_url:
+      query = urllib.parse.parse_qs(urllib.parse.urlparse(last_url).query)
+      try:
+        last_page = int(query["page"][0])
+      except (KeyError, ValueError):
+        # Without a usable page number, only the first page is returned.
+        last_page = 1
+      with concurrent.futures.ThreadPoolExecutor(
+          max_workers=_MAX_PAGE_WORKERS
+      ) as executor:
+        futures = [
+            executor.submit(_get_commits_page, commits_url, p)
+            for p in range(2, last_page + 1)
+        ]
+        for page, future in enumerate(futures, start=2):
+          pages.append(future.result().json())
+  except requests.exceptions.HTTPError as e:
+    print(
+        f"HTTP Error fetching PR commits (page {page}):"
+        f" {e.response.status_code} - {e.response.text}"
+    )
+  except requests.exceptions.RequestException as e:
+    print(f"Network or request error fetching PR commits (page {page}): {e}")
+  return pages
+
 
 def get_github_pr_info_http(pr_number: int) -> str | None:
   """Fetches information for a GitHub Pull Request by sending direct HTTP requests.
@@ -38,22 +108,16 @@ def get_github_pr_info_http(pr_number: int) -> str | None:
   """
   base_url = "https://api.github.com"
 
-  headers = {
-      "Accept": "application/vnd.github+json",
-      "Authorization": f"Bearer {GITHUB_TOKEN}",
-      "X-GitHub-Api-Version": "2022-11-28",
-  }
-
-  pr_message = ""
+  pr_lines = []
 
   # --- 1. Get main PR details ---
   pr_url = f"{base_url}/repos/{OWNER}/{REPO}/pulls/{pr_number}"
   print(f"Fetching PR details from: {pr_url}")
   try:
-    response = requests.get(pr_url, headers=headers)
+    response = _SESSION.get(pr_url, timeout=_TIMEOUT_SECONDS)
     response.raise_for_status()
     pr_data = response.json()
-    pr_message += f"The PR title is: {pr_data.get('title')}\n"
+    pr_lines.append(f"The PR title is: {pr_data.get('title')}")
   except requests.exceptions.HTTPError as e:
     print(
         f"HTTP Error fetching PR details: {e.response.status_code} - "
@@ -73,53 +137,21 @@ def get_github_pr_info_http(pr_number: int) -> str | None:
   )  # This URL is provided in the initial PR response
   if commits_url:
     print("\n--- Associated Commits in this PR: ---")
-    page = 1
-    while True:
-      # GitHub API often uses 'per_page' and 'page' for pagination
-      params = {
-          "per_page": 100,
-          "page": page,
-      }  # Fetch up to 100 commits per page
-      try:
-        response = requests.get(commits_url, headers=headers, params=params)
-        response.raise_for_status()
-        commits_data = response.json()
-
-        if not commits_data:  # No more commits
-          break
-
-        pr_message += "The associated commits are:\n"
-        for commit in commits_data:
-          message = commit.get("commit", {}).get("message", "").splitlines()[0]
-          if message:
-            pr_message += message + "\n"
-
-        # Check for 'Link' header to determine if more pages exist
-        # This is how GitHub's API indicates pagination
-        if "Link" in response.headers:
-          link_header = response.headers["Link"]
-          if 'rel="next"' in link_header:
-            page += 1  # Move to the next page
-          else:
-            break  # No more pages
-        else:
-          break  # No Link header, so probably only one page
-
-      except requests.exceptions.HTTPError as e:
-        print(
-            f"HTTP Error fetching PR commits (page {page}):"
-            f" {e.response.status_code} - {e.response.text}"
-        )
-        break
-      except requests.exceptions.RequestException as e:
-        print(
-            f"Network or request error fetching PR commits (page {page}): {e}"
-        )
-        break
+    subjects = []
+    for commits_data in _get_commit_pages(commits_url):
+      for commit in commits_data:
+        message = commit.get("commit", {}).get("message", "")
+        # Keep only the subject line; commits with an empty message are skipped.
+        subject = message.split("\n", 1)[0].rstrip()
+        if subject:
+          subjects.append(subject)
+    if subjects:
+      pr_lines.append("The associated commits are:")
+      pr_lines.extend(subjects)
   else:
     print("Commits URL not found in PR data.")
 
-  return pr_message
+  return "\n".join(pr_lines) + "\n"
 
 
 system_prompt = """
@@ -14,8 +14,12 @@
 
 from __future__ import annotations
 
+from typing import Annotated
+from typing import Any
 from typing import Union
 
+from pydantic import Field
+from pydantic import model_validator
 from pydantic import RootModel
 
 from ..utils.feature_decorator import working_in_progress
@@ -24,12 +28,17 @@ from .loop_agent import LoopAgentConfig
 from .parallel_agent import ParallelAgentConfig
 from .sequential_agent import SequentialAgentConfig
 
-# A discriminated union of all possible agent configurations.
-ConfigsUnion = Union[
-    LlmAgentConfig,
-    LoopAgentConfig,
-    ParallelAgentConfig,
-    SequentialAgentConfig,
+# A discriminated union of all possible agent configurations. Discriminating
+# on `agent_class` picks the matching config class directly instead of trying
+# each member of the union in turn.
+ConfigsUnion = Annotated[
+    Union[
+        LlmAgentConfig,
+        LoopAgentConfig,
+        ParallelAgentConfig,
+        SequentialAgentConfig,
+    ],
+    Field(discriminator="agent_class"),
 ]
 
 
@@ -39,8 +48,11 @@ ConfigsUnion = Union[
 class AgentConfig(RootModel[ConfigsUnion]):
   """The config for the YAML schema to create an agent."""
 
-  class Config:
-    # Pydantic v2 requires this for discriminated unions on RootModel
-    # This tells the model to look at the 'agent_class' field of the input
-    # data to decide which model from the `ConfigsUnion` to use.
-    discriminator = "agent_class"
+  @model_validator(mode="before")
+  @classmethod
+  def _default_agent_class(cls, data: Any) -> Any:
+    # `agent_class` may be omitted for an LlmAgent, but the discriminator needs
+    # it to be present to select the config class.
+    if isinstance(data, dict) and "agent_class" not in data:
+      return {**data, "agent_class": "LlmAgent"}
+    return data
@@ -17,7 +17,9 @@ from __future__ import annotations
 import importlib
 import os
 from typing import Any
+from typing import Dict
 from typing import List
+from typing import Type
 
 import yaml
 
@@ -35,6 +37,20 @@ from .parallel_agent import ParallelAgentConfig
 from .sequential_agent import SequentialAgent
 from .sequential_agent import SequentialAgentConfig
 
+try:
+  # The libyaml-backed loader is much faster than the pure-Python one.
+  from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+  from yaml import SafeLoader as _YamlSafeLoader
+
+# The agent class built from each config type in `AgentConfig`.
+_AGENT_CLASSES_BY_CONFIG_TYPE: Dict[type, Type[BaseAgent]] = {
+    LlmAgentConfig: LlmAgent,
+    LoopAgentConfig: LoopAgent,
+    ParallelAgentConfig: ParallelAgent,
+    SequentialAgentConfig: SequentialAgent,
+}
+
 
 @working_in_progress("from_config is not ready for use.")
 def from_config(config_path: str) -> BaseAgent:
@@ -54,16 +70,10 @@ def from_config(config_path: str) -> BaseAgent:
   abs_path = os.path.abspath(config_path)
   config = _load_config_from_path(abs_path)
 
-  if isinstance(config.root, LlmAgentConfig):
-    return LlmAgent.from_config(config.root, abs_path)
-  elif isinstance(config.root, LoopAgentConfig):
-    return LoopAgent.from_config(config.root, abs_path)
-  elif isinstance(config.root, ParallelAgentConfig):
-    return ParallelAgent.from_config(config.root, abs_path)
-  elif isinstance(config.root, SequentialAgentConfig):
-    return SequentialAgent.from_config(config.root, abs_path)
-  else:
+  agent_class = _AGENT_CLASSES_BY_CONFIG_TYPE.get(type(config.root))
+  if agent_class is None:
     raise ValueError("Unsupported config type")
+  return agent_class.from_config(config.root, abs_path)
 
 
 @working_in_progress("_load_config_from_path is not ready for use.")
@@ -84,8 +94,9 @@ def _load_config_from_path(config_path: str) -> AgentConfig:
   if not os.path.exists(config_path):
     raise FileNotFoundError(f"Config file not found: {config_path}")
 
-  with open(config_path, "r", encoding="utf-8") as f:
-    config_data = yaml.safe_load(f)
+  # libyaml detects the encoding and decodes raw bytes itself.
+  with open(config_path, "rb") as f:
+    config_data = yaml.load(f, Loader=_YamlSafeLoader)
 
   return AgentConfig.model_validate(config_data)
 
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
 import inspect
 import logging
@@ -109,6 +110,16 @@ ToolUnion: TypeAlias = Union[Callable, BaseTool, BaseToolset]
 ExamplesUnion = Union[list[Example], BaseExampleProvider]
 
 
+@functools.cache
+def _get_builtin_tool(name: str) -> Any:
+  """Look up a built-in tool by name in `google.adk.tools`.
+
+  The set of built-in tools is fixed, so each name is only looked up once.
+  """
+  module = importlib.import_module('google.adk.tools')
+  return getattr(module, name)
+
+
 async def _convert_tool_union_to_tools(
     tool_union: ToolUnion, ctx: ReadonlyContext
 ) -> list[BaseTool]:
@@ -539,8 +550,7 @@ class LlmAgent(BaseAgent):
     resolved_tools = []
     for tool_config in tools_config:
       if '.' not in tool_config.name:
-        module = importlib.import_module('google.adk.tools')
-        obj = getattr(module, tool_config.name)
+        obj = _get_builtin_tool(tool_config.name)
         if isinstance(obj, ToolUnion):
           resolved_tools.append(obj)
         else:
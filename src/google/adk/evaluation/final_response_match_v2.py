@@ -14,8 +14,10 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
-import re
+import string
 from typing import Optional
 
 from typing_extensions import override
@@ -32,6 +34,13 @@ from .llm_as_judge_utils import get_eval_status
 from .llm_as_judge_utils import get_text_from_content
 from .llm_as_judge_utils import Label
 
+try:
+  # re2 matches in linear time, so malformed judge responses cannot trigger
+  # catastrophic backtracking in the label regexes below.
+  import re2 as _re_engine
+except ImportError:
+  import re as _re_engine
+
 logger = logging.getLogger("google_adk." + __name__)
 
 _FINAL_RESPONSE_MATCH_V2_PROMPT = """You are an expert rater for an AI agent. The AI agent is going to call an API to answer the user query and generate API tool use code based for the choice of the API and API arguments. The ideal model response should be a function call that fulfills user query, or a natural language response hedges or asks users for further clarification if a function call does not apply.
@@ -77,52 +86,174 @@ Answer with assertiveness:
 
 _DEFAULT_NUM_SAMPLES = 5
 
+# Score for each label the critique can resolve to. NOT_FOUND has no score.
+_LABEL_TO_SCORE: dict[Label, float] = {Label.VALID: 1.0, Label.INVALID: 0.0}
+
+_PromptTemplateParts = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_prompt_template(template: str) -> _PromptTemplateParts:
+  """Splits a str.format template into literal chunks and field names.
+
+  Formatting the parsed template is a join of the literal chunks interleaved
+  with the field values, so the template is not rescanned for every prompt.
+  Results are cached, so evaluators sharing a template share its parts.
+  Only plain named fields, without conversions or format specs, are supported.
+
+  Args:
+    template: The prompt template, in str.format syntax.
+
+  Returns:
+    A tuple of (literals, field_names), where len(literals) is
+    len(field_names) + 1.
+  """
+  literals = []
+  field_names = []
+  pending_literal = ""
+  for literal, field_name, format_spec, conversion in string.Formatter().parse(
+      template
+  ):
+    # Escaped braces are reported as separate literals, so literals are
+    # accumulated until the next field.
+    pending_literal += literal
+    if field_name is None:
+      continue
+    if not field_name or format_spec or conversion:
+      raise ValueError(
+          "Prompt template fields must be plain named fields, got"
+          f" {{{field_name}}}."
+      )
+    literals.append(pending_literal)
+    field_names.append(field_name)
+    pending_literal = ""
+  literals.append(pending_literal)
+  return tuple(literals), tuple(field_names)
+
+
+def _format_prompt_template(
+    template_parts: _PromptTemplateParts, **values: Optional[str]
+) -> str:
+  literals, field_names = template_parts
+  parts = [literals[0]]
+  for field_name, literal in zip(field_names, literals[1:]):
+    parts.append(str(values[field_name]))
+    parts.append(literal)
+  return "".join(parts)
+
+
+# Regex matching the label field in the response, in a single pass. The
+# "kind" group is set when the model names the label field as
+# "is_the_agent_response_*invalid*" instead of "..._*valid*". The end of the
+# field is identified by either a comma, new line, or an end-bracket.
+#
+# The label may be quoted, follow "[ ", or follow "[" directly, and each case
+# has its own group. Branching on the character after the opening brackets
+# keeps every whitespace and quote run matched by a single quantifier, so the
+# search stays linear on the `re` fallback as well as on re2.
+_RESPONSE_LABEL_RE = _re_engine.compile(
+    r'"is_the_agent_response_(?P<kind>in)?valid":\s*(?:'
+    r'(?:\[+\s*)?"+(?:(?P<quoted_label>[^"\]\s]+)"*)?\s*'
+    r'|\[+\s+(?:(?P<spaced_label>[^"\]\s]+)"*\s*)?'
+    r'|\[*(?P<label>[^"\[\]\s][^"\]\s]*)"*\s*'
+    r"|\[+"
+    r")?(?:\]+\s*)?[,\n\}]"
+)
+
+
+def _strip_code_fence(response: str) -> str:
+  """Returns the response without a surrounding markdown code fence."""
+  text = response.strip()
+  if not text.startswith("```"):
+    return text
+  newline = text.find("\n")
+  if newline == -1:
+    return text
+  text = text[newline + 1 :]
+  if text.endswith("```"):
+    text = text[:-3]
+  return text
+
+
+def _label_from_valid_field(label: str) -> Label:
+  if label in [
+      Label.INVALID.value,
+      Label.ALMOST.value,
+      Label.FALSE.value,
+      *Label.PARTIALLY_VALID.value,
+  ]:
+    return Label.INVALID
+  elif label in [Label.VALID.value, Label.TRUE.value]:
+    return Label.VALID
+  else:
+    return Label.NOT_FOUND
+
+
+def _label_from_invalid_field(label: str) -> Label:
+  return (
+      Label.INVALID
+      if label in [Label.TRUE.value, Label.INVALID.value]
+      else Label.VALID
+  )
+
+
+def _parse_critique_json(response: str) -> Optional[Label]:
+  """Extracts the label from a critique that is well-formed JSON.
+
+  Returns None if the critique is not a JSON object with a string label field,
+  in which case the caller should fall back to regex matching.
+  """
+  try:
+    critique = json.loads(_strip_code_fence(response), strict=False)
+  except ValueError:
+    return None
+  if not isinstance(critique, dict):
+    return None
+  if "is_the_agent_response_valid" in critique:
+    field = critique["is_the_agent_response_valid"]
+    label_from_field = _label_from_valid_field
+  elif "is_the_agent_response_invalid" in critique:
+    field = critique["is_the_agent_response_invalid"]
+    label_from_field = _label_from_invalid_field
+  else:
+    return None
+  if isinstance(field, list) and len(field) == 1:
+    field = field[0]
+  if not isinstance(field, str):
+    return None
+  return label_from_field(field.strip())
+
 
 def _parse_critique(response: str) -> Label:
   """Parses the judge model critique and extracts the final label.
 
+  The critique is parsed as JSON first. Malformed critiques (e.g. with trailing
+  commas or unquoted labels) are handled by matching the label field with a
+  regex.
+
   Args:
     response: model response
 
   Returns:
     The extracted label, either VALID, INVALID, or NOT_FOUND.
   """
-  # Regex matching the label field in the response. The end of the field is
-  # identified by either a comma, new line, or an end-bracket.
-  label_match_is_response_valid = re.search(
-      r'"is_the_agent_response_valid":\s*\[*[\n\s]*"*([^"^\]^\s]*)"*[\n\s]*\]*\s*[,\n\}]',
-      response,
-  )
-  # In case the model names the label field as "is_the_agent_response_*invalid*"
-  # instead of "..._*valid*"
-  label_match_is_response_invalid = re.search(
-      r'"is_the_agent_response_invalid":\s*\[*[\n\s]*"*([^"^\]^\s]*)"*[\n\s]*\]*\s*[,\n\}]',
-      response,
+  label = _parse_critique_json(response)
+  if label is not None:
+    return label
+  label_match = _RESPONSE_LABEL_RE.search(response)
+  if not label_match:
+    return Label.NOT_FOUND
+  label = (
+      label_match.group("label")
+      or label_match.group("quoted_label")
+      or label_match.group("spaced_label")
+      or ""
   )
   # Remove any trailing whitespace, commas, or end-brackets from the label.
-  if label_match_is_response_valid:
-    label = label_match_is_response_valid.group(1).strip(r"\s,\}")
-    if label in [
-        Label.INVALID.value,
-        Label.ALMOST.value,
-        Label.FALSE.value,
-        *Label.PARTIALLY_VALID.value,
-    ]:
-      label = Label.INVALID
-    elif label in [Label.VALID.value, Label.TRUE.value]:
-      label = Label.VALID
-    else:
-      label = Label.NOT_FOUND
-  elif label_match_is_response_invalid:
-    label = label_match_is_response_invalid.group(1).strip(r"\s,\}")
-    label = (
-        Label.INVALID
-        if label in [Label.TRUE.value, Label.INVALID.value]
-        else Label.VALID
-    )
-  else:
-    label = Label.NOT_FOUND
-  return label
+  label = label.strip(r"\s,\}")
+  if label_match.group("kind"):
+    return _label_from_invalid_field(label)
+  return _label_from_valid_field(label)
 
 
 @experimental
@@ -153,7 +284,8 @@ class FinalResponseMatchV2Evaluator(LlmAsJudge):
     reference = get_text_from_content(expected_invocation.final_response)
     response = get_text_from_content(actual_invocation.final_response)
     user_prompt = get_text_from_content(expected_invocation.user_content)
-    return self._auto_rater_prompt_template.format(
+    return _format_prompt_template(
+        _parse_prompt_template(self._auto_rater_prompt_template),
         prompt=user_prompt,
         response=response,
         golden_response=reference,
@@ -166,13 +298,7 @@ class FinalResponseMatchV2Evaluator(LlmAsJudge):
     response_text = get_text_from_content(llm_response.content)
     if response_text is None:
       return None
-    label = _parse_critique(response_text)
-    if label == Label.VALID:
-      return 1.0
-    elif label == Label.INVALID:
-      return 0.0
-    else:
-      return None
+    return _LABEL_TO_SCORE.get(_parse_critique(response_text))
 
   @override
   def aggregate_per_invocation_samples(
@@ -212,15 +338,20 @@ class FinalResponseMatchV2Evaluator(LlmAsJudge):
   def aggregate_invocation_results(
       self, per_invocation_results: list[PerInvocationResult]
   ) -> EvaluationResult:
-    """Computes the fraction of invocation results that are valid."""
-    num_valid = 0
-    num_evaluated = 0
-    for result in per_invocation_results:
-      if result.score is None or result.eval_status == EvalStatus.NOT_EVALUATED:
-        continue
-      num_evaluated += 1
-      num_valid += result.score
-    overall_score = num_valid / num_evaluated
+    """Computes the fraction of invocation results that are valid.
+
+    If none of the invocations were successfully evaluated, the overall score
+    is None and the overall status is NOT_EVALUATED.
+    """
+    evaluated_scores = [
+        result.score
+        for result in per_invocation_results
+        if result.score is not None
+        and result.eval_status is not EvalStatus.NOT_EVALUATED
+    ]
+    if not evaluated_scores:
+      return EvaluationResult(per_invocation_results=per_invocation_results)
+    overall_score = sum(evaluated_scores) / len(evaluated_scores)
     return EvaluationResult(
         overall_score=overall_score,
         overall_eval_status=get_eval_status(
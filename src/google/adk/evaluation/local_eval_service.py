@@ -233,9 +233,11 @@ class LocalEvalService(BaseEvalService):
           expected_invocations=eval_case.conversation,
       )
 
-      # Track overall scrore across all invocations.
+      # Track overall scrore across all invocations. The fields come from the
+      # already validated eval metric and evaluator output, so the results are
+      # built without re-running validation.
       overall_eval_metric_results.append(
-          EvalMetricResult(
+          EvalMetricResult.model_construct(
               metric_name=eval_metric.metric_name,
               threshold=eval_metric.threshold,
               score=evaluation_result.overall_score,
@@ -258,7 +260,7 @@ class LocalEvalService(BaseEvalService):
           eval_metric_result_per_invocation,
       ):
         invocation.eval_metric_results.append(
-            EvalMetricResult(
+            EvalMetricResult.model_construct(
                 metric_name=eval_metric.metric_name,
                 threshold=eval_metric.threshold,
                 score=invocation_result.score,
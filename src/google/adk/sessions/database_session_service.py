@@ -535,7 +535,7 @@ class DatabaseSessionService(BaseSessionService):
 
   @override
   async def append_event(self, session: Session, event: Event) -> Event:
-    logger.info(f"Append event: {event} to session {session.id}")
+    logger.debug("Append event: %s to session %s", event, session.id)
 
     if event.partial:
       return event
@@ -158,21 +158,24 @@ class InMemorySessionService(BaseSessionService):
       return None
 
     session = self.sessions[app_name][user_id].get(session_id)
-    copied_session = copy.deepcopy(session)
 
+    # Select the requested events before copying, so that events filtered out
+    # by the config are never deep-copied.
+    events = session.events
     if config:
       if config.num_recent_events:
-        copied_session.events = copied_session.events[
-            -config.num_recent_events :
-        ]
+        events = events[-config.num_recent_events :]
       if config.after_timestamp:
-        i = len(copied_session.events) - 1
+        i = len(events) - 1
         while i >= 0:
-          if copied_session.events[i].timestamp < config.after_timestamp:
+          if events[i].timestamp < config.after_timestamp:
             break
           i -= 1
         if i >= 0:
-          copied_session.events = copied_session.events[i + 1 :]
+          events = events[i + 1 :]
+    copied_session = copy.deepcopy(
+        session.model_copy(update={'events': events})
+    )
 
     return self._merge_state(app_name, user_id, copied_session)
 
@@ -222,10 +225,11 @@ class InMemorySessionService(BaseSessionService):
 
     sessions_without_events = []
     for session in self.sessions[app_name][user_id].values():
-      copied_session = copy.deepcopy(session)
-      copied_session.events = []
-      copied_session.state = {}
-      sessions_without_events.append(copied_session)
+      # The remaining fields are immutable, so a shallow copy without events
+      # and state is as independent as a deep copy and avoids copying them.
+      sessions_without_events.append(
+          session.model_copy(update={'events': [], 'state': {}})
+      )
     return ListSessionsResponse(sessions=sessions_without_events)
 
   @override
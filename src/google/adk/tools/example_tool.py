@@ -29,6 +29,10 @@ from .tool_context import ToolContext
 if TYPE_CHECKING:
   from ..models.llm_request import LlmRequest
 
+# Building a TypeAdapter compiles a validation schema, so it is built once and
+# shared by all ExampleTool instances.
+_EXAMPLE_LIST_ADAPTER = TypeAdapter(list[Example])
+
 
 class ExampleTool(BaseTool):
   """A tool that adds (few-shot) examples to the LLM request.
@@ -42,7 +46,7 @@ class ExampleTool(BaseTool):
     # llm_request.
     super().__init__(name='example_tool', description='example tool')
     self.examples = (
-        TypeAdapter(list[Example]).validate_python(examples)
+        _EXAMPLE_LIST_ADAPTER.validate_python(examples)
         if isinstance(examples, list)
         else examples
     )
@@ -22,6 +22,7 @@ from typing import Optional
 from google.genai import types
 from typing_extensions import override
 
+from ..utils.variant_utils import GoogleLLMVariant
 from ._automatic_function_calling_util import build_function_declaration
 from .base_tool import BaseTool
 from .tool_context import ToolContext
@@ -60,20 +61,33 @@ class FunctionTool(BaseTool):
     super().__init__(name=name, description=doc)
     self.func = func
     self._ignore_params = ['tool_context', 'input_stream']
+    self._declaration_cache: dict[
+        GoogleLLMVariant, types.FunctionDeclaration
+    ] = {}
 
   @override
   def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
-    function_decl = types.FunctionDeclaration.model_validate(
-        build_function_declaration(
-            func=self.func,
-            # The model doesn't understand the function context.
-            # input_stream is for streaming tool
-            ignore_params=self._ignore_params,
-            variant=self._api_variant,
-        )
-    )
-
-    return function_decl
+    # Building the declaration inspects the function signature and generates
+    # its schema, and is otherwise repeated for every LLM request. The function
+    # and ignored params are fixed once the tool is constructed, so the result
+    # only depends on the API variant.
+    variant = self._api_variant
+    function_decl = self._declaration_cache.get(variant)
+    if function_decl is None:
+      function_decl = types.FunctionDeclaration.model_validate(
+          build_function_declaration(
+              func=self.func,
+              # The model doesn't understand the function context.
+              # input_stream is for streaming tool
+              ignore_params=self._ignore_params,
+              variant=variant,
+          )
+      )
+      self._declaration_cache[variant] = function_decl
+
+    # Callers may modify the returned declaration, e.g. LongRunningFunctionTool
+    # appends to its description, so the cached one is never handed out.
+    return function_decl.model_copy(deep=True)
 
   @override
   async def run_async(
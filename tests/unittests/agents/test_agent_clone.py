@@ -156,12 +156,20 @@ def test_three_level_nested_agent():
   assert len(cloned_leaf2.sub_agents) == 0
   assert isinstance(cloned_leaf2, LlmAgent)
 
-  # Verify all objects are different from originals
-  assert cloned_root is not root_agent
-  assert cloned_middle1 is not middle_agent1
-  assert cloned_middle2 is not middle_agent2
-  assert cloned_leaf1 is not leaf_agent1
-  assert cloned_leaf2 is not leaf_agent2
+  # Verify all objects are different from originals and from each other
+  all_agents = [
+      root_agent,
+      middle_agent1,
+      middle_agent2,
+      leaf_agent1,
+      leaf_agent2,
+      cloned_root,
+      cloned_middle1,
+      cloned_middle2,
+      cloned_leaf1,
+      cloned_leaf2,
+  ]
+  assert len({id(agent) for agent in all_agents}) == len(all_agents)
 
   # Verify original structure is unchanged
   assert root_agent.name == "root_agent"
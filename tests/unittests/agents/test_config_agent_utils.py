@@ -0,0 +1,157 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for config_agent_utils."""
+
+import sys
+import types
+
+from google.adk.agents import config_agent_utils
+from google.adk.agents import llm_agent
+from google.adk.agents.common_configs import ArgumentConfig
+from google.adk.agents.common_configs import CodeConfig
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.llm_agent import LlmAgentConfig
+from google.adk.agents.loop_agent import LoopAgent
+from google.adk.agents.loop_agent import LoopAgentConfig
+from google.adk.agents.sequential_agent import SequentialAgentConfig
+from google.adk.tools import google_search
+from pydantic import ValidationError
+import pytest
+
+_MODULE_NAME = 'test_config_agent_utils_fake_module'
+
+
+def _make_tool(prefix: str = 'tool'):
+  def make_tool(suffix: str = ''):
+    return f'{prefix}{suffix}'
+
+  return make_tool
+
+
+@pytest.fixture
+def fake_module():
+  module = types.ModuleType(_MODULE_NAME)
+  module.make_tool = _make_tool()
+  sys.modules[_MODULE_NAME] = module
+  yield module
+  sys.modules.pop(_MODULE_NAME, None)
+
+
+def test_resolve_code_reference_sees_patched_attribute(
+    fake_module, monkeypatch
+):
+  code_config = CodeConfig(name=f'{_MODULE_NAME}.make_tool')
+  first = config_agent_utils.resolve_code_reference(code_config)
+
+  patched = _make_tool('patched')
+  monkeypatch.setattr(fake_module, 'make_tool', patched)
+  second = config_agent_utils.resolve_code_reference(code_config)
+
+  assert first is not patched
+  assert second is patched
+
+
+def test_resolve_code_reference_calls_callable_with_args(fake_module):
+  def code_config(suffix):
+    return CodeConfig(
+        name=f'{_MODULE_NAME}.make_tool',
+        args=[ArgumentConfig(name='suffix', value=suffix)],
+    )
+
+  assert config_agent_utils.resolve_code_reference(code_config('_a')) == (
+      'tool_a'
+  )
+  assert config_agent_utils.resolve_code_reference(code_config('_b')) == (
+      'tool_b'
+  )
+
+
+@pytest.mark.parametrize(
+    'yaml_content, expected_type',
+    [
+        ('name: a\ninstruction: hi\n', LlmAgentConfig),
+        ('agent_class: ""\nname: a\ninstruction: hi\n', LlmAgentConfig),
+        (
+            'agent_class: LoopAgent\nname: a\nmax_iterations: 2\n',
+            LoopAgentConfig,
+        ),
+        ('agent_class: SequentialAgent\nname: a\n', SequentialAgentConfig),
+    ],
+)
+def test_load_config_from_path_selects_config_class(
+    tmp_path, yaml_content, expected_type
+):
+  config_path = tmp_path / 'root_agent.yaml'
+  config_path.write_text(yaml_content)
+
+  config = config_agent_utils._load_config_from_path(str(config_path))
+
+  assert type(config.root) is expected_type
+
+
+def test_load_config_from_path_rejects_unknown_agent_class(tmp_path):
+  config_path = tmp_path / 'root_agent.yaml'
+  config_path.write_text('agent_class: UnknownAgent\nname: a\n')
+
+  with pytest.raises(ValidationError, match='union_tag_invalid'):
+    config_agent_utils._load_config_from_path(str(config_path))
+
+
+def test_load_config_from_path_missing_file(tmp_path):
+  with pytest.raises(FileNotFoundError):
+    config_agent_utils._load_config_from_path(str(tmp_path / 'missing.yaml'))
+
+
+def test_from_config_builds_agent_for_config_type(tmp_path):
+  (tmp_path / 'sub_agent.yaml').write_text('name: sub\ninstruction: hi\n')
+  config_path = tmp_path / 'root_agent.yaml'
+  config_path.write_text(
+      'agent_class: LoopAgent\n'
+      'name: root\n'
+      'max_iterations: 2\n'
+      'sub_agents:\n'
+      '  - config: sub_agent.yaml\n'
+  )
+
+  agent = config_agent_utils.from_config(str(config_path))
+
+  assert isinstance(agent, LoopAgent)
+  assert agent.max_iterations == 2
+  assert isinstance(agent.sub_agents[0], LlmAgent)
+  assert agent.sub_agents[0].instruction == 'hi'
+
+
+def test_resolve_builtin_tool_by_short_name():
+  tools = LlmAgent._resolve_tools(
+      [CodeConfig(name='google_search'), CodeConfig(name='google_search')]
+  )
+
+  assert tools == [google_search, google_search]
+
+
+def test_resolve_builtin_tool_looks_up_each_name_once():
+  llm_agent._get_builtin_tool.cache_clear()
+
+  LlmAgent._resolve_tools(
+      [CodeConfig(name='google_search'), CodeConfig(name='google_search')]
+  )
+
+  cache_info = llm_agent._get_builtin_tool.cache_info()
+  assert (cache_info.misses, cache_info.hits) == (1, 1)
+
+
+def test_resolve_unknown_builtin_tool_raises():
+  with pytest.raises(AttributeError):
+    LlmAgent._resolve_tools([CodeConfig(name='no_such_builtin_tool')])
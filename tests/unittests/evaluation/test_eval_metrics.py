@@ -0,0 +1,79 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from google.adk.evaluation.eval_case import Invocation
+from google.adk.evaluation.eval_metrics import EvalMetric
+from google.adk.evaluation.eval_metrics import EvalMetricResult
+from google.adk.evaluation.eval_metrics import EvalMetricResultPerInvocation
+from google.adk.evaluation.evaluator import EvalStatus
+from google.genai import types as genai_types
+import pytest
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {
+            "metric_name": "final_response_match_v2",
+            "threshold": 0.5,
+            "judge_model_options": {"num_samples": 3},
+        },
+        {
+            "metricName": "final_response_match_v2",
+            "threshold": 0.5,
+            "judgeModelOptions": {"num_samples": 3},
+        },
+    ],
+)
+def test_eval_metric_accepts_snake_and_camel_case(data):
+  eval_metric = EvalMetric.model_validate(data)
+
+  assert eval_metric.metric_name == "final_response_match_v2"
+  assert eval_metric.judge_model_options.num_samples == 3
+
+
+def test_eval_metric_result_per_invocation_round_trips_by_alias():
+  invocation = Invocation(
+      user_content=genai_types.Content(
+          parts=[genai_types.Part(text="This is a test query.")],
+          role="user",
+      )
+  )
+  result = EvalMetricResultPerInvocation(
+      actual_invocation=invocation,
+      expected_invocation=invocation,
+      eval_metric_results=[
+          EvalMetricResult(
+              metric_name="tool_trajectory_avg_score",
+              threshold=1.0,
+              score=1.0,
+              eval_status=EvalStatus.PASSED,
+          )
+      ],
+  )
+
+  data = result.model_dump(by_alias=True)
+
+  assert set(data) == {
+      "actualInvocation",
+      "expectedInvocation",
+      "evalMetricResults",
+  }
+  assert data["evalMetricResults"][0]["metricName"] == (
+      "tool_trajectory_avg_score"
+  )
+  assert data["evalMetricResults"][0]["evalStatus"] == EvalStatus.PASSED
+  assert EvalMetricResultPerInvocation.model_validate(data) == result
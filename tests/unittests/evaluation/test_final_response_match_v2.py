@@ -14,12 +14,17 @@
 
 from __future__ import annotations
 
+import re
+import time
+
+from google.adk.evaluation import final_response_match_v2
 from google.adk.evaluation.eval_case import Invocation
 from google.adk.evaluation.eval_metrics import EvalMetric
 from google.adk.evaluation.eval_metrics import JudgeModelOptions
 from google.adk.evaluation.evaluator import EvalStatus
 from google.adk.evaluation.evaluator import PerInvocationResult
 from google.adk.evaluation.final_response_match_v2 import _parse_critique
+from google.adk.evaluation.final_response_match_v2 import _RESPONSE_LABEL_RE
 from google.adk.evaluation.final_response_match_v2 import FinalResponseMatchV2Evaluator
 from google.adk.evaluation.llm_as_judge_utils import Label
 from google.adk.models.llm_response import LlmResponse
@@ -104,6 +109,83 @@ def test_parse_critique_invalid(response_text):
   assert label == Label.INVALID
 
 
+@pytest.mark.parametrize(
+    "response_text, expected_label",
+    [
+        (
+            """{"is_the_agent_response_valid": "partially valid"}""",
+            Label.INVALID,
+        ),
+        (
+            """```json
+  {
+    "reasoning": {"is_the_agent_response_valid": "invalid"},
+    "is_the_agent_response_valid": "valid"
+  }
+  ```""",
+            Label.VALID,
+        ),
+        ("""{"is_the_agent_response_valid": true}""", Label.VALID),
+    ],
+)
+def test_parse_critique_json(response_text, expected_label):
+  assert _parse_critique(response_text) == expected_label
+
+
+def test_response_label_re_allows_caret_in_label():
+  label_match = _RESPONSE_LABEL_RE.search(
+      '{"is_the_agent_response_invalid": [^valid],}'
+  )
+
+  assert label_match.group("kind") == "in"
+  assert label_match.group("label") == "^valid"
+
+
+@pytest.mark.parametrize(
+    "response_text, expected_label",
+    [
+        ('"is_the_agent_response_valid": [ "valid" ]\n', Label.VALID),
+        ('"is_the_agent_response_valid": [\n  valid\n]', Label.VALID),
+        ('"is_the_agent_response_valid": ""valid"" ,', Label.VALID),
+        ('"is_the_agent_response_valid":\n\n"invalid"\n', Label.INVALID),
+        ('"is_the_agent_response_valid": [[,', Label.NOT_FOUND),
+        ('"is_the_agent_response_invalid": [ [true,', Label.VALID),
+        ('"is_the_agent_response_invalid": "[true]",', Label.NOT_FOUND),
+    ],
+)
+def test_parse_critique_label_layouts(response_text, expected_label):
+  assert _parse_critique(response_text) == expected_label
+
+
+def test_parse_critique_pathological_response_is_linear():
+  pytest.importorskip("re2")
+  response_text = '"is_the_agent_response_valid":' + " " * 100_000 + "x"
+
+  start = time.perf_counter()
+  label = _parse_critique(response_text)
+
+  assert label == Label.NOT_FOUND
+  assert time.perf_counter() - start < 1.0
+
+
+@pytest.mark.parametrize("filler", [" ", '"', "[", "[ ", ' "'])
+def test_parse_critique_pathological_response_is_linear_on_re_fallback(
+    filler, monkeypatch
+):
+  monkeypatch.setattr(
+      final_response_match_v2,
+      "_RESPONSE_LABEL_RE",
+      re.compile(_RESPONSE_LABEL_RE.pattern),
+  )
+  response_text = '"is_the_agent_response_valid":' + filler * 10_000 + "x"
+
+  start = time.perf_counter()
+  label = _parse_critique(response_text)
+
+  assert label == Label.NOT_FOUND
+  assert time.perf_counter() - start < 1.0
+
+
 def create_test_template() -> str:
   return """
 This is a test template.
@@ -191,6 +273,25 @@ The answer should be a json alone which follows the json structure below:
 """
 
 
+def test_format_auto_rater_prompt_after_template_change():
+  evaluator = _create_test_evaluator_gemini(threshold=0.8)
+  actual_invocation, expected_invocation = _create_test_invocations(
+      "candidate text", "reference text"
+  )
+  evaluator.format_auto_rater_prompt(actual_invocation, expected_invocation)
+
+  evaluator._auto_rater_prompt_template = (
+      "{{{response}}} vs {golden_response} for {prompt}"
+  )
+  prompt = evaluator.format_auto_rater_prompt(
+      actual_invocation, expected_invocation
+  )
+
+  assert prompt == (
+      "{candidate text} vs reference text for This is a test query."
+  )
+
+
 def test_convert_auto_rater_response_to_score_valid():
   evaluator = _create_test_evaluator_gemini(threshold=0.8)
   auto_rater_response = """```json
@@ -476,3 +577,34 @@ def test_aggregate_invocation_results():
   # Only 4 / 8 invocations are evaluated, and 2 / 4 are valid.
   assert aggregated_result.overall_score == 0.5
   assert aggregated_result.overall_eval_status == EvalStatus.PASSED
+
+
+def test_aggregate_invocation_results_none_evaluated():
+  evaluator = _create_test_evaluator_gemini(threshold=0.5)
+
+  actual_invocation, expected_invocation = _create_test_invocations(
+      "candidate text", "reference text"
+  )
+
+  per_invocation_results = [
+      PerInvocationResult(
+          actual_invocation=actual_invocation,
+          expected_invocation=expected_invocation,
+          score=None,
+          eval_status=EvalStatus.NOT_EVALUATED,
+      ),
+      PerInvocationResult(
+          actual_invocation=actual_invocation,
+          expected_invocation=expected_invocation,
+          score=1.0,
+          eval_status=EvalStatus.NOT_EVALUATED,
+      ),
+  ]
+
+  aggregated_result = evaluator.aggregate_invocation_results(
+      per_invocation_results
+  )
+
+  assert aggregated_result.overall_score is None
+  assert aggregated_result.overall_eval_status == EvalStatus.NOT_EVALUATED
+  assert aggregated_result.per_invocation_results == per_invocation_results
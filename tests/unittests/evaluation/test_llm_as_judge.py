@@ -219,3 +219,34 @@ async def test_evaluate_invocations_with_mock(
   assert mock_llm_as_judge.format_auto_rater_prompt.call_count == 2
   assert mock_llm_as_judge.convert_auto_rater_response_to_score.call_count == 6
   assert mock_llm_as_judge.aggregate_invocation_results.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_evaluate_invocations_validates_sample_scores(
+    mock_llm_as_judge, mock_judge_model
+):
+  mock_llm_as_judge._judge_model = mock_judge_model
+  mock_llm_as_judge.convert_auto_rater_response_to_score = MagicMock(
+      return_value=1
+  )
+  mock_aggregate_per_invocation_samples = MagicMock(
+      wraps=mock_llm_as_judge.aggregate_per_invocation_samples
+  )
+  mock_llm_as_judge.aggregate_per_invocation_samples = (
+      mock_aggregate_per_invocation_samples
+  )
+  invocation = Invocation(
+      user_content=genai_types.Content(
+          parts=[genai_types.Part(text="user content")],
+          role="user",
+      ),
+      final_response=genai_types.Content(
+          parts=[genai_types.Part(text="final response")],
+          role="model",
+      ),
+  )
+
+  await mock_llm_as_judge.evaluate_invocations([invocation], [invocation])
+
+  samples = mock_aggregate_per_invocation_samples.call_args.args[0]
+  assert [type(sample.score) for sample in samples] == [float] * 3
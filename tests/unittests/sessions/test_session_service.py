@@ -117,6 +117,34 @@ async def test_create_and_list_sessions(service_type):
     assert sessions[i].id == session_ids[i]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+)
+async def test_list_sessions_omits_events(service_type):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  user_id = 'test_user'
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id, state={'key': 'value'}
+  )
+  await session_service.append_event(session, Event(author='user'))
+
+  list_sessions_response = await session_service.list_sessions(
+      app_name=app_name, user_id=user_id
+  )
+  listed_session = list_sessions_response.sessions[0]
+  assert listed_session.id == session.id
+  assert not listed_session.events
+  listed_session.state['key'] = 'changed'
+
+  session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert len(session.events) == 1
+  assert session.state['key'] == 'value'
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
@@ -398,3 +426,32 @@ async def test_get_session_with_config(service_type):
   )
   events = session.events
   assert len(events) == num_test_events - after_timestamp + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'service_type', [SessionServiceType.IN_MEMORY, SessionServiceType.DATABASE]
+)
+async def test_get_session_with_config_returns_copies(service_type):
+  session_service = get_session_service(service_type)
+  app_name = 'my_app'
+  user_id = 'user'
+  session = await session_service.create_session(
+      app_name=app_name, user_id=user_id
+  )
+  for i in range(1, 4):
+    await session_service.append_event(
+        session, Event(author='user', timestamp=i)
+    )
+
+  config = GetSessionConfig(num_recent_events=1)
+  session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id, config=config
+  )
+  session.events[0].author = 'changed'
+  session.events.clear()
+
+  session = await session_service.get_session(
+      app_name=app_name, user_id=user_id, session_id=session.id
+  )
+  assert [event.author for event in session.events] == ['user'] * 3
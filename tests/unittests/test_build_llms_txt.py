@@ -0,0 +1,151 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for contributing/dev/utils/build_llms_txt.py."""
+
+import importlib.util
+from pathlib import Path
+import sys
+import types
+
+import pytest
+
+_SCRIPT_PATH = (
+    Path(__file__).resolve().parents[2]
+    / 'contributing'
+    / 'dev'
+    / 'utils'
+    / 'build_llms_txt.py'
+)
+
+
+@pytest.fixture(scope='module')
+def build_llms_txt():
+  spec = importlib.util.spec_from_file_location('build_llms_txt', _SCRIPT_PATH)
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+@pytest.mark.parametrize(
+    'md, expected',
+    [
+        ('# T\n\nIntro **line**.\n\nmore', 'Intro line.'),
+        ('# T\nIntro line\n## Install\n\nmore', 'Intro line'),
+        ('```bash\npip install x\n```\n\nIntro line', 'Intro line'),
+        ('Intro line\n```bash\npip install x\n```', 'Intro line'),
+        ('~~~\n# not a heading\n~~~\nIntro line', 'Intro line'),
+        ('- item one\n- item two\n\nIntro line', 'Intro line'),
+        ('1. step\n2. step\n\nIntro line', 'Intro line'),
+        ('Intro line\n- item', 'Intro line'),
+        ('<p align="center">\nLogo\n</p>\n\nIntro line', 'Intro line'),
+        ('![logo](logo.png)\n\nSee [docs](https://x.y).', 'See docs.'),
+        ('*Emphasis* at the start', 'Emphasis at the start'),
+        ('# Only a heading', ''),
+    ],
+)
+def test_first_paragraph(build_llms_txt, md, expected):
+  assert build_llms_txt.first_paragraph(md) == expected
+
+
+@pytest.mark.parametrize(
+    'md, expected',
+    [
+        ('a\n```java\nint x;\n```\nb', 'a\n\nb'),
+        ('a\n```java\nint x;\n', 'a\n```java\nint x;\n'),
+        ('```javascript\nlet x;\n```', '```javascript\nlet x;\n```'),
+        ('```JAVA\nint x;\n```', ''),
+        ('```java\nint x;\n``````java\nint y;\n```', ''),
+        ('```java\nint x;\n```\n```java\nint y;\n```tail', '\ntail'),
+        ('```python\nx = 1\n```', '```python\nx = 1\n```'),
+    ],
+)
+def test_strip_java(build_llms_txt, md, expected):
+  assert build_llms_txt.strip_java(md) == expected
+
+
+def test_md_files_sorted_and_skips_java_api_reference(build_llms_txt, tmp_path):
+  for rel in [
+      'b.md',
+      'a/z.md',
+      'a/b/c.md',
+      'A.md',
+      'notes.txt',
+      'api-reference/java/index.md',
+      'api-reference/java/deep/page.md',
+      'api-reference/python/index.md',
+      'java/intro.md',
+  ]:
+    path = tmp_path / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('# T\n')
+
+  assert build_llms_txt.md_files(tmp_path) == [
+      str(Path(rel))
+      for rel in sorted(
+          p.relative_to(tmp_path)
+          for p in tmp_path.rglob('*.md')
+          if not ('api-reference' in p.parts and 'java' in p.parts)
+      )
+  ]
+  assert build_llms_txt.md_files(tmp_path) == [
+      str(Path(rel))
+      for rel in [
+          'A.md',
+          'a/b/c.md',
+          'a/z.md',
+          'api-reference/python/index.md',
+          'b.md',
+          'java/intro.md',
+      ]
+  ]
+
+
+def test_read_utf8_normalises_line_endings(build_llms_txt, tmp_path):
+  path = tmp_path / 'page.md'
+  path.write_bytes('# T\r\n\r\nCafé\r\nold mac\rend\r\n'.encode('utf-8'))
+
+  assert build_llms_txt.read_utf8(path) == '# T\n\nCafé\nold mac\nend\n'
+
+
+def test_expand_code_snippets_on_crlf_page(build_llms_txt, tmp_path):
+  (tmp_path / 'snippet.py').write_bytes(b'print("hi")\r\n')
+  page = tmp_path / 'page.md'
+  page.write_bytes(b'Intro\r\n\r\n    --8<-- "snippet.py"\r\nOutro\r\n')
+
+  expanded = build_llms_txt.expand_code_snippets(
+      build_llms_txt.read_utf8(page), tmp_path
+  )
+
+  assert expanded == 'Intro\n\n    print("hi")\n\nOutro\n'
+
+
+def test_count_tokens_caches_failed_encoding(build_llms_txt, monkeypatch):
+  calls = []
+
+  def get_encoding(model):
+    calls.append(model)
+    raise OSError('offline')
+
+  monkeypatch.setitem(
+      sys.modules, 'riptoken', types.SimpleNamespace(get_encoding=get_encoding)
+  )
+  build_llms_txt.get_encoding.cache_clear()
+  try:
+    counts = [build_llms_txt.count_tokens('one two three') for _ in range(3)]
+  finally:
+    build_llms_txt.get_encoding.cache_clear()
+
+  assert counts == [3, 3, 3]
+  assert calls == ['cl100k_base']
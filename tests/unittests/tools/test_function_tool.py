@@ -13,11 +13,14 @@
 # limitations under the License.
 
 from unittest.mock import MagicMock
+from unittest.mock import patch
 
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.sessions.session import Session
+from google.adk.tools import function_tool
 from google.adk.tools.function_tool import FunctionTool
 from google.adk.tools.tool_context import ToolContext
+from google.adk.utils.variant_utils import GoogleLLMVariant
 import pytest
 
 
@@ -107,6 +110,46 @@ def test_init():
   assert tool.func == function_for_testing_with_no_args
 
 
+def test_get_declaration_built_once_per_variant(monkeypatch):
+  """Test that the declaration is built once for each API variant."""
+
+  def sample_func(arg1: str, arg2: int) -> str:
+    """Sample function."""
+    return arg1 * arg2
+
+  tool = FunctionTool(sample_func)
+
+  with patch.object(
+      function_tool,
+      "build_function_declaration",
+      wraps=function_tool.build_function_declaration,
+  ) as mock_build:
+    monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "0")
+    gemini_declarations = [tool._get_declaration() for _ in range(3)]
+    monkeypatch.setenv("GOOGLE_GENAI_USE_VERTEXAI", "1")
+    vertex_declarations = [tool._get_declaration() for _ in range(3)]
+
+  assert mock_build.call_count == 2
+  assert [call.kwargs["variant"] for call in mock_build.call_args_list] == [
+      GoogleLLMVariant.GEMINI_API,
+      GoogleLLMVariant.VERTEX_AI,
+  ]
+  assert all(d == gemini_declarations[0] for d in gemini_declarations)
+  assert all(d == vertex_declarations[0] for d in vertex_declarations)
+
+
+def test_get_declaration_returns_independent_copies():
+  """Test that modifying a returned declaration does not affect later ones."""
+  tool = FunctionTool(function_for_testing_with_no_args)
+
+  first = tool._get_declaration()
+  first.description = "changed"
+  second = tool._get_declaration()
+
+  assert first is not second
+  assert second.description == "Function for testing with no args."
+
+
 @pytest.mark.asyncio
 async def test_function_returning_none():
   """Test that the function returns with None actually returning None."""
@@ -104,6 +104,15 @@ class TestLongRunningFunctionTool:
     )
     assert declaration.description == expected_warning
 
+  def test_get_declaration_adds_warning_once(self):
+    """Test that repeated _get_declaration calls add the warning only once."""
+    tool = LongRunningFunctionTool(sample_long_running_function)
+    first = tool._get_declaration()
+    second = tool._get_declaration()
+
+    assert first.description == second.description
+    assert second.description.count("NOTE: This is a long-running") == 1
+
   def test_get_declaration_returns_none_when_parent_returns_none(self):
     """Test that _get_declaration returns None when parent method returns None."""
     tool = LongRunningFunctionTool(sample_long_running_function)